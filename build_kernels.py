@@ -0,0 +1,31 @@
+"""
+Compiles the swatch grid kernels ahead of time into the swatch_kernels
+extension module, so Swatch.py does not pay Numba's JIT warm-up on each run.
+
+Usage: python build_kernels.py
+
+Re-run this after editing any _build_grid_* kernel in Swatch.py, and bump
+Swatch.KERNELS_VERSION with the edit. The built module records the version
+it was built from; Swatch.py ignores it (with a message) and falls back to
+JIT compilation when the versions differ.
+
+Afterwards, run python -m pytest test_swatch.py to check the built module
+against the original overprint behaviour.
+"""
+from numba.pycc import CC
+
+from Swatch import _build_grid_0v, _build_grid_1v, _build_grid_2v, KERNELS_VERSION
+
+cc = CC('swatch_kernels')
+
+# Arguments are float32 arrays: static CMYK (4,), then (base (4,), tints (11,)) per variable colour
+cc.export('build_grid_0v', 'f4[:,:,::1](f4[:])')(_build_grid_0v)
+cc.export('build_grid_1v', 'f4[:,:,::1](f4[:], f4[:], f4[:])')(_build_grid_1v)
+cc.export('build_grid_2v', 'f4[:,:,::1](f4[:], f4[:], f4[:], f4[:], f4[:])')(_build_grid_2v)
+
+@cc.export('kernels_version', 'i8()')
+def kernels_version():
+    return KERNELS_VERSION # Frozen into the module at compile time
+
+if __name__ == '__main__':
+    cc.compile()
@@ -0,0 +1,182 @@
+"""
+Tests for Swatch.py. The grid kernels and the generated chart are checked against
+a reference copy of the original script's per-layer overprint and axis labels.
+"""
+import builtins
+
+import numpy as np
+import pytest
+from reportlab.pdfgen import canvas
+
+import Swatch
+
+# CMYK definitions of the original script, values 0.0-1.0
+ORIGINAL_CMYK_DEFINITIONS = {
+    "Cyan": (1.0, 0.0, 0.0, 0.0),
+    "Magenta": (0.0, 1.0, 0.0, 0.0),
+    "Yellow": (0.0, 0.0, 1.0, 0.0),
+    "Black": (0.0, 0.0, 0.0, 1.0),
+    "Orange": (0.0, 0.7, 0.7, 0.0),
+    "Violet": (0.7, 0.7, 0.0, 0.0),
+    "Grey": (0.0, 0.0, 0.0, 0.7),
+}
+COLOUR_ORDER = list(ORIGINAL_CMYK_DEFINITIONS)
+
+
+def overprint_layer(current_cmyk_percent, layer_cmyk_base, layer_tint_percent):
+    """The original overprint: add one tinted layer, capping each channel at 100%."""
+    tint_factor = layer_tint_percent / 100.0
+    return tuple(min(100, base + layer_def * tint_factor * 100)
+                 for base, layer_def in zip(current_cmyk_percent, layer_cmyk_base))
+
+
+def reference_cell(static_tints, variable_layers, k_row, i_col):
+    """
+    CMYK percentages of one cell, layered one colour at a time as in the original script.
+    static_tints: {colour name: tint} for non-variable colours
+    variable_layers: [(colour name, tint per step)] for the X-axis then the Y-axis colour
+    """
+    cell = (0.0, 0.0, 0.0, 0.0)
+    for name in COLOUR_ORDER:
+        tint_val = static_tints.get(name, 0)
+        if tint_val > 0:
+            cell = overprint_layer(cell, ORIGINAL_CMYK_DEFINITIONS[name], tint_val)
+    for (name, tints), step_idx in zip(variable_layers, (i_col, k_row)):
+        cell = overprint_layer(cell, ORIGINAL_CMYK_DEFINITIONS[name], tints[step_idx])
+    return cell
+
+
+def original_tints(start_val, step_val):
+    return [max(0, min(100, start_val + i * step_val)) for i in range(11)]
+
+
+def kernel_configurations():
+    """Every GRID_KERNELS configuration Swatch.py can select, skipping unavailable ones."""
+    kernels = (Swatch._build_grid_0v, Swatch._build_grid_1v, Swatch._build_grid_2v)
+    configurations = [pytest.param([Swatch._build_grid_broadcast] * 3, id="numpy")]
+    try:
+        from numba import njit
+        configurations.append(pytest.param([njit(kernel) for kernel in kernels], id="jit"))
+    except ImportError:
+        configurations.append(pytest.param(None, id="jit", marks=pytest.mark.skip("Numba is not installed")))
+    if Swatch.swatch_kernels is not None:
+        aot = Swatch.swatch_kernels
+        configurations.append(pytest.param([aot.build_grid_0v, aot.build_grid_1v, aot.build_grid_2v], id="aot"))
+    else:
+        configurations.append(pytest.param(None, id="aot", marks=pytest.mark.skip("swatch_kernels is not built")))
+    return configurations
+
+
+@pytest.mark.parametrize("grid_kernels", kernel_configurations())
+def test_grid_kernels_match_original_overprint(grid_kernels):
+    rng = np.random.default_rng(0)
+    for _ in range(200):
+        # Random static tints with most colours left at 0%, as in typical charts
+        static_tints = {name: int(rng.integers(0, 101)) if rng.random() < 0.4 else 0 for name in COLOUR_ORDER}
+        step_val = int(rng.integers(1, 10))
+        variable_layers = [(COLOUR_ORDER[rng.integers(0, 7)], original_tints(int(rng.integers(-20, 101)), step_val))
+                           for _ in range(rng.integers(0, 3))]
+
+        static_cmyk = Swatch.CMYK_TABLE.T @ np.array([static_tints[name] for name in COLOUR_ORDER], dtype=np.float32)
+        kernel_args = [static_cmyk]
+        for name, tints in variable_layers:
+            kernel_args.append(Swatch.CMYK_TABLE[Swatch.COLOUR_INDEX[name]])
+            kernel_args.append(np.array(tints, dtype=np.float32))
+        grid = grid_kernels[len(variable_layers)](*kernel_args)
+
+        for k_row in range(11):
+            for i_col in range(11):
+                expected = reference_cell(static_tints, variable_layers, k_row, i_col)
+                assert grid[k_row, i_col].tolist() == pytest.approx(expected, abs=1e-3)
+
+
+class RecordingCanvas(canvas.Canvas):
+    """Canvas that records the filled boxes and axis label strings it is asked to draw."""
+    last = None
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        RecordingCanvas.last = self
+        self.boxes = [] # (x, y, fill colour)
+        self.centred_strings = []
+        self.right_strings = []
+        self._recorded_fill = None
+
+    def setFillColor(self, aColor, alpha=None):
+        self._recorded_fill = aColor
+        super().setFillColor(aColor, alpha)
+
+    def drawPath(self, aPath, *args, **kwargs):
+        tokens = aPath.getCode().split()
+        for idx, token in enumerate(tokens):
+            if token == "re":
+                self.boxes.append((float(tokens[idx - 4]), float(tokens[idx - 3]), self._recorded_fill))
+        super().drawPath(aPath, *args, **kwargs)
+
+    def drawCentredString(self, x, y, text, *args, **kwargs):
+        self.centred_strings.append(text)
+        super().drawCentredString(x, y, text, *args, **kwargs)
+
+    def drawRightString(self, x, y, text, *args, **kwargs):
+        self.right_strings.append(text)
+        super().drawRightString(x, y, text, *args, **kwargs)
+
+
+def random_chart_inputs(rng):
+    """Returns the answers to create_swatch_pdf's prompts, and the settings they describe."""
+    answers = [str(rng.integers(200, 600)), str(rng.integers(200, 600))]
+    static_tints, variable_data = {}, []
+    for name in COLOUR_ORDER:
+        if rng.random() < 0.35:
+            answers.append("v")
+            if len(variable_data) < 2:
+                median = int(rng.integers(0, 101))
+                answers.append(str(median))
+                variable_data.append((name, median))
+            continue
+        tint_val = int(rng.integers(0, 101)) if rng.random() < 0.5 else 0
+        answers.append(str(tint_val))
+        static_tints[name] = tint_val
+    step_val = int(rng.integers(1, 10))
+    answers += [str(step_val), "Test"]
+    return answers, static_tints, variable_data, step_val
+
+
+def original_start_val(median, step_val):
+    start_val = median - (step_val * 5)
+    if (step_val * 5) + median > 100:
+        start_val = 100 - (step_val * 10)
+    if (median - (step_val * 5)) < 0:
+        start_val = 0
+    return start_val
+
+
+@pytest.mark.parametrize("grid_kernels", kernel_configurations())
+def test_chart_matches_original(grid_kernels, monkeypatch, tmp_path):
+    monkeypatch.setattr(Swatch, "GRID_KERNELS", grid_kernels)
+    monkeypatch.setattr(canvas, "Canvas", RecordingCanvas)
+    rng = np.random.default_rng(1)
+    for chart_idx in range(40):
+        answers, static_tints, variable_data, step_val = random_chart_inputs(rng)
+        replies = iter(answers)
+        monkeypatch.setattr(builtins, "input", lambda prompt="": next(replies))
+        Swatch.create_swatch_pdf(str(tmp_path / f"chart_{chart_idx}.pdf"))
+        drawn = RecordingCanvas.last
+
+        variable_layers = [(name, original_tints(original_start_val(median, step_val), step_val))
+                           for name, median in variable_data]
+        xs = sorted({x for x, _, _ in drawn.boxes})
+        ys = sorted({y for _, y, _ in drawn.boxes})
+        assert len(drawn.boxes) == 121 and len(xs) == 11 and len(ys) == 11
+        for x, y, fill in drawn.boxes:
+            expected = reference_cell(static_tints, variable_layers, ys.index(y), xs.index(x))
+            actual = (fill.cyan, fill.magenta, fill.yellow, fill.black)
+            assert actual == pytest.approx([v / 100.0 for v in expected], abs=1e-4)
+
+        # Axis labels as formatted by the original script
+        labels = [[str(int(round(v))) for v in tints] for _, tints in variable_layers]
+        expected_centred = [variable_layers[0][0]] + labels[0] if variable_layers else []
+        if len(variable_layers) > 1:
+            expected_centred.append(variable_layers[1][0])
+        assert drawn.centred_strings == expected_centred
+        assert drawn.right_strings == (labels[1] if len(variable_layers) > 1 else [])